@@ -1,7 +1,13 @@
 """
 Configuration for pytest tests, including fixtures and mock data for testing the wolfsoftware.get-aws-regions package.
 
+Options:
+- --use-aws-cache: Persist region lookups made by moto-backed tests in .pytest_cache and reuse them for 12 hours.
+
 Fixtures:
+- aws_mock: Runs the whole test session against moto's in-memory AWS backend, so no test can reach real AWS.
+- aws_cache: Loads and saves the on-disk region lookup cache when --use-aws-cache is given.
+- moto_session: Clears the package caches so a test talks to the moto backend rather than a previously mocked session.
 - boto3_session_mock: Mocks the boto3 session for AWS interactions.
 - boto3_session_mock_with_exception: Mocks the boto3 session raising an exception during describe_regions.
 
@@ -10,10 +16,18 @@ Mock Data:
 - mock_description: A dictionary representing the mock description of a specific AWS region.
 """
 
-from typing import Any, Dict, Generator, List
+import copy
+import pickle  # nosec: B403
+import time
+
+from typing import Any, Callable, Dict, Generator, List, Optional
 from unittest.mock import MagicMock, patch
 import pytest
 
+from moto import mock_aws
+
+from wolfsoftware.get_aws_regions import functions
+
 # Mock data
 mock_regions: List[Dict[str, str]] = [
     {"RegionName": "us-east-1", "OptInStatus": "opt-in-not-required"},
@@ -27,58 +41,184 @@ mock_description: Dict[str, str] = {
     "/aws/service/global-infrastructure/regions/eu-west-1/longName": "EU West (Ireland)"
 }
 
+# How long responses saved by --use-aws-cache are reused
+AWS_CACHE_TTL_SECONDS: int = 12 * 60 * 60
 
-@pytest.fixture
-def boto3_session_mock() -> Generator[MagicMock, None, None]:
+
+def pytest_addoption(parser: pytest.Parser) -> None:
     """
-    Fixture to mock the boto3 session.
+    Register the --use-aws-cache command line option.
+
+    Arguments:
+        parser (pytest.Parser): The pytest command line parser.
+    """
+    parser.addoption(
+        "--use-aws-cache",
+        action="store_true",
+        default=False,
+        help="Persist region lookups made by moto-backed tests in .pytest_cache and reuse them for 12 hours."
+    )
+
+
+def _clear_caches() -> None:
+    """Clear the cached sessions, clients and results so the next call builds them afresh."""
+    functions._get_session.cache_clear()  # pylint: disable=protected-access
+    functions._get_client.cache_clear()  # pylint: disable=protected-access
+    functions.get_region_list.cache_clear()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def aws_mock() -> Generator[None, None, None]:
+    """
+    Fixture to run the whole test session against moto's in-memory AWS backend.
+
+    The mock is started once with dummy credentials and without resetting the default boto3 session
+    between uses, so its setup cost is paid once per session.
 
     Yields:
-        MagicMock: A mock of the boto3 session.
+        None
     """
-    with patch("boto3.Session") as mock_session:
-        mock_session_instance: Any = mock_session.return_value
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+        monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+        monkeypatch.delenv("AWS_PROFILE", raising=False)
 
-        regions_mock = MagicMock()
-        ssm_mock = MagicMock()
+        with mock_aws(config={"core": {"reset_boto3_session": False}}):
+            yield
 
-        def mock_get_parameter(Name) -> Dict[str, Dict[str, str]]:
-            if Name in mock_description:
-                return {"Parameter": {"Value": mock_description[Name]}}
-            raise ValueError(f"Unknown parameter name: {Name}")
 
-        ssm_mock.get_parameter.side_effect = mock_get_parameter
+@pytest.fixture(scope="session")
+def aws_cache(request: pytest.FixtureRequest) -> Generator[Optional[Dict[str, Any]], None, None]:
+    """
+    Fixture to load the on-disk region lookup cache at the start of the session and save it at the end.
 
-        mock_session_instance.client.side_effect = lambda service_name, *args, **kwargs: ssm_mock if service_name == "ssm" else regions_mock
+    Arguments:
+        request (pytest.FixtureRequest): The pytest request, used to read the --use-aws-cache option.
 
-        regions_mock.describe_regions.return_value = {"Regions": mock_regions}
+    Yields:
+        Optional[Dict[str, Any]]: The cached responses keyed by call, or None if --use-aws-cache was not given.
+    """
+    # The cache directory is unavailable when the cacheprovider plugin is disabled (-p no:cacheprovider)
+    if not request.config.getoption("--use-aws-cache") or getattr(request.config, "cache", None) is None:
+        yield None
+        return
 
-        yield mock_session
+    path: Any = request.config.cache.mkdir("aws-regions") / "aws-regions.pkl"
+
+    cache: Dict[str, Any] = {"created": time.time(), "responses": {}}
+    fresh: bool = False
+    if path.exists():
+        with path.open("rb") as f:
+            stored: Dict[str, Any] = pickle.load(f)  # nosec: B301
+        if time.time() - stored["created"] < AWS_CACHE_TTL_SECONDS:
+            cache = stored
+            fresh = True
+
+    stored_count: int = len(cache["responses"])
+
+    yield cache["responses"]
+
+    # Only rewrite the file when it was missing or expired, or when new responses were recorded
+    if not fresh or len(cache["responses"]) != stored_count:
+        with path.open("wb") as f:
+            pickle.dump(cache, f)
+
+
+def _cached_call(responses: Dict[str, Any], name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wrap a function so its results are served from, and recorded in, the region lookup cache.
+
+    Arguments:
+        responses (Dict[str, Any]): The cached responses keyed by call.
+        name (str): The name of the wrapped function, used in the cache key.
+        func (Callable[..., Any]): The function to wrap.
+
+    Returns:
+        Callable[..., Any]: The wrapped function.
+    """
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        key: str = repr((name, args, sorted(kwargs.items())))
+        if key not in responses:
+            responses[key] = func(*args, **kwargs)
+        return copy.deepcopy(responses[key])
+
+    return wrapper
 
 
 @pytest.fixture
-def boto3_session_mock_with_exception() -> Generator[MagicMock, None, None]:
+def moto_session(aws_cache: Optional[Dict[str, Any]], monkeypatch: pytest.MonkeyPatch) -> None:
     """
-    Fixture to mock the boto3 session raising an exception during describe_regions.
+    Fixture to clear the package caches so the test talks to the moto backend.
+
+    With --use-aws-cache, the region and description lookups are served from the on-disk cache instead.
+
+    Arguments:
+        aws_cache (fixture): The cached responses, or None if caching is disabled.
+        monkeypatch (fixture): Used to install the caching wrappers for the duration of the test.
+    """
+    _clear_caches()
+
+    if aws_cache is not None:
+        for name in ("_fetch_all_regions", "_fetch_region_descriptions"):
+            monkeypatch.setattr(functions, name, _cached_call(aws_cache, name, getattr(functions, name)))
+
+
+def _mock_boto3_session(describe_regions_side_effect: Optional[Exception] = None) -> Generator[MagicMock, None, None]:
+    """
+    Patch boto3.Session with mocked EC2 and SSM clients backed by the mock data.
+
+    The session and client caches are cleared first so the patched session is picked up.
+
+    Arguments:
+        describe_regions_side_effect (Optional[Exception]): An exception for describe_regions to raise, if any.
 
     Yields:
         MagicMock: A mock of the boto3 session.
     """
+    _clear_caches()
+
     with patch("boto3.Session") as mock_session:
         mock_session_instance: Any = mock_session.return_value
 
         regions_mock = MagicMock()
         ssm_mock = MagicMock()
 
-        def mock_get_parameter(Name) -> Dict[str, Dict[str, str]]:
-            if Name in mock_description:
-                return {"Parameter": {"Value": mock_description[Name]}}
-            raise ValueError(f"Unknown parameter name: {Name}")
+        def mock_get_parameters(Names) -> Dict[str, List[Any]]:
+            return {
+                "Parameters": [{"Name": name, "Value": mock_description[name]} for name in Names if name in mock_description],
+                "InvalidParameters": [name for name in Names if name not in mock_description]
+            }
 
-        ssm_mock.get_parameter.side_effect = mock_get_parameter
+        ssm_mock.get_parameters.side_effect = mock_get_parameters
 
-        regions_mock.describe_regions.side_effect = Exception("Test Exception")
+        if describe_regions_side_effect is not None:
+            regions_mock.describe_regions.side_effect = describe_regions_side_effect
+        else:
+            regions_mock.describe_regions.return_value = {"Regions": mock_regions}
 
         mock_session_instance.client.side_effect = lambda service_name, *args, **kwargs: ssm_mock if service_name == "ssm" else regions_mock
 
         yield mock_session
+
+
+@pytest.fixture
+def boto3_session_mock() -> Generator[MagicMock, None, None]:
+    """
+    Fixture to mock the boto3 session.
+
+    Yields:
+        MagicMock: A mock of the boto3 session.
+    """
+    yield from _mock_boto3_session()
+
+
+@pytest.fixture
+def boto3_session_mock_with_exception() -> Generator[MagicMock, None, None]:
+    """
+    Fixture to mock the boto3 session raising an exception during describe_regions.
+
+    Yields:
+        MagicMock: A mock of the boto3 session.
+    """
+    yield from _mock_boto3_session(Exception("Test Exception"))
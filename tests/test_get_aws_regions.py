@@ -6,15 +6,32 @@ Tests:
 - test_get_region_list_include_filter: Tests fetching regions with an include filter.
 - test_get_region_list_exclude_filter: Tests fetching regions with an exclude filter.
 - test_get_region_list_no_details: Tests fetching region names without details.
+- test_get_region_list_bundled_descriptions: Tests fetching details from the bundled geographical locations.
+- test_get_region_list_empty_details: Tests fetching details when the filters remove every region.
+- test_get_region_list_cached: Tests that repeated calls are served from the result cache.
+- test_get_region_list_refresh_not_cached: Tests that live lookups neither read nor populate the result cache.
+- test_get_region_list_cache_bounded: Tests that the result cache purges expired entries and evicts the oldest.
+- test_get_region_list_moto: Tests fetching regions from moto's EC2 and SSM backends.
+- test_get_region_list_bundled_descriptions_match_ssm: Tests that the bundled geographical locations cover every region and match SSM.
 - test_get_region_list_exceptions: Tests exception handling when an error occurs in fetching regions.
+- test_get_region_list_description_exceptions: Tests exception handling when an error occurs in fetching geographical locations.
+- test_fetch_region_descriptions_cancels_pending_batches: Tests that pending batches are cancelled after the first failure.
+- test_fetch_region_descriptions_after_fork: Tests that a forked child can still fetch geographical locations.
 """
 
-from typing import Any, Dict, List, Optional
+import os
+import signal
+import threading
 
-import importlib.metadata
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Any, Dict, List
+
+import boto3  # pylint: disable=import-error
 import pytest
 
-from wolfsoftware.get_aws_regions import get_region_list, RegionListingError
+from wolfsoftware.get_aws_regions import __version__, get_region_list, RegionListingError
+from wolfsoftware.get_aws_regions import functions
 
 from .conftest import mock_regions
 
@@ -23,18 +40,11 @@ def test_version() -> None:
     """
     Test to ensure the version of the Package is set and not 'unknown'.
 
-    This test retrieves the version of the package using importlib.metadata and asserts that the version
+    This test uses the __version__ resolved once at package import and asserts that the version
     is not None and not 'unknown'.
     """
-    version: Optional[str] = None
-
-    try:
-        version = importlib.metadata.version('wolfsoftware.get_aws_regions')
-    except importlib.metadata.PackageNotFoundError:
-        version = None
-
-    assert version is not None, "Version should be set"  # nosec: B101
-    assert version != 'unknown', f"Expected version, but got {version}"  # nosec: B101
+    assert __version__ is not None, "Version should be set"  # nosec: B101
+    assert __version__ != 'unknown', f"Expected version, but got {__version__}"  # nosec: B101
 
 
 def test_get_region_list_all_regions(boto3_session_mock) -> None:
@@ -47,15 +57,15 @@ def test_get_region_list_all_regions(boto3_session_mock) -> None:
     regions_mock: Any = boto3_session_mock.return_value.client.return_value
     regions_mock.describe_regions.return_value = {"Regions": mock_regions}
 
-    result: List[Dict[str, str | bool]] | List[str] = get_region_list(details=True)
-    result.sort(key=lambda x: x["RegionName"])  # Sort the result for consistent ordering
+    result: List[Dict[str, str | bool]] | List[str] = get_region_list(details=True, refresh_descriptions=True)
+    result.sort(key=itemgetter("RegionName"))  # Sort the result for consistent ordering
 
     expected_result: List[Dict[str, str]] = [
         {"RegionName": "us-east-1", "OptInStatus": "opt-in-not-required", "GeographicalLocation": "US East (N. Virginia)"},
         {"RegionName": "us-west-1", "OptInStatus": "opt-in-not-required", "GeographicalLocation": "US West (N. California)"},
         {"RegionName": "eu-west-1", "OptInStatus": "opted-in", "GeographicalLocation": "EU West (Ireland)"}
     ]
-    expected_result.sort(key=lambda x: x["RegionName"])  # Sort the expected result for consistent ordering
+    expected_result.sort(key=itemgetter("RegionName"))  # Sort the expected result for consistent ordering
 
     assert result == expected_result  # nosec: B101
 
@@ -71,14 +81,14 @@ def test_get_region_list_include_filter(boto3_session_mock) -> None:
 
     regions_mock.describe_regions.return_value = {"Regions": mock_regions}
 
-    result: List[Dict[str, str | bool]] | List[str] = get_region_list(include_list=["us-east-1", "eu-west-1"], details=True)
-    result.sort(key=lambda x: x["RegionName"])  # Sort the result for consistent ordering
+    result: List[Dict[str, str | bool]] | List[str] = get_region_list(include_list=["us-east-1", "eu-west-1"], details=True, refresh_descriptions=True)
+    result.sort(key=itemgetter("RegionName"))  # Sort the result for consistent ordering
 
     expected_result: List[Dict[str, str]] = [
         {"RegionName": "us-east-1", "OptInStatus": "opt-in-not-required", "GeographicalLocation": "US East (N. Virginia)"},
         {"RegionName": "eu-west-1", "OptInStatus": "opted-in", "GeographicalLocation": "EU West (Ireland)"}
     ]
-    expected_result.sort(key=lambda x: x["RegionName"])  # Sort the expected result for consistent ordering
+    expected_result.sort(key=itemgetter("RegionName"))  # Sort the expected result for consistent ordering
 
     assert result == expected_result  # nosec: B101
 
@@ -94,14 +104,14 @@ def test_get_region_list_exclude_filter(boto3_session_mock) -> None:
 
     regions_mock.describe_regions.return_value = {"Regions": mock_regions}
 
-    result: List[Dict[str, str | bool]] | List[str] = get_region_list(exclude_list=["us-west-1"], details=True)
-    result.sort(key=lambda x: x["RegionName"])  # Sort the result for consistent ordering
+    result: List[Dict[str, str | bool]] | List[str] = get_region_list(exclude_list=["us-west-1"], details=True, refresh_descriptions=True)
+    result.sort(key=itemgetter("RegionName"))  # Sort the result for consistent ordering
 
     expected_result: List[Dict[str, str]] = [
         {"RegionName": "us-east-1", "OptInStatus": "opt-in-not-required", "GeographicalLocation": "US East (N. Virginia)"},
         {"RegionName": "eu-west-1", "OptInStatus": "opted-in", "GeographicalLocation": "EU West (Ireland)"}
     ]
-    expected_result.sort(key=lambda x: x["RegionName"])  # Sort the expected result for consistent ordering
+    expected_result.sort(key=itemgetter("RegionName"))  # Sort the expected result for consistent ordering
 
     assert result == expected_result  # nosec: B101
 
@@ -126,6 +136,150 @@ def test_get_region_list_no_details(boto3_session_mock) -> None:
     assert result == expected_result  # nosec: B101
 
 
+def test_get_region_list_bundled_descriptions(boto3_session_mock) -> None:
+    """
+    Test fetching details from the bundled geographical locations without querying SSM.
+
+    Arguments:
+        boto3_session_mock (fixture): The mocked boto3 session.
+    """
+    ssm_mock: Any = boto3_session_mock.return_value.client("ssm")
+
+    result: List[Dict[str, str | bool]] | List[str] = get_region_list(include_list=["us-east-1", "eu-west-1"], details=True)
+
+    expected_result: List[Dict[str, str]] = [
+        {"RegionName": "eu-west-1", "OptInStatus": "opted-in", "GeographicalLocation": "Europe (Ireland)"},
+        {"RegionName": "us-east-1", "OptInStatus": "opt-in-not-required", "GeographicalLocation": "US East (N. Virginia)"}
+    ]
+
+    assert result == expected_result  # nosec: B101
+    ssm_mock.get_parameters.assert_not_called()
+
+
+def test_get_region_list_empty_details(boto3_session_mock) -> None:
+    """
+    Test fetching details when the filters remove every region, which should not query SSM.
+
+    Arguments:
+        boto3_session_mock (fixture): The mocked boto3 session.
+    """
+    ssm_mock: Any = boto3_session_mock.return_value.client("ssm")
+
+    result: List[Dict[str, str | bool]] | List[str] = get_region_list(include_list=[], details=True, refresh_descriptions=True)
+
+    assert result == []  # nosec: B101
+    ssm_mock.get_parameters.assert_not_called()
+
+
+def test_get_region_list_cached(boto3_session_mock) -> None:
+    """
+    Test that repeated calls are served from the result cache until it is cleared.
+
+    Arguments:
+        boto3_session_mock (fixture): The mocked boto3 session.
+    """
+    regions_mock: Any = boto3_session_mock.return_value.client("ec2")
+
+    first: List[Dict[str, str | bool]] | List[str] = get_region_list(details=False)
+    first.append("mutated")
+    second: List[Dict[str, str | bool]] | List[str] = get_region_list(details=False)
+
+    assert second == ["eu-west-1", "us-east-1", "us-west-1"]  # nosec: B101
+    assert regions_mock.describe_regions.call_count == 1  # nosec: B101
+
+    get_region_list.cache_clear()  # type: ignore[attr-defined]
+    get_region_list(details=False)
+
+    assert regions_mock.describe_regions.call_count == 2  # nosec: B101
+
+
+def test_get_region_list_moto(moto_session) -> None:  # pylint: disable=unused-argument
+    """
+    Test fetching regions from moto's EC2 and SSM backends.
+
+    Arguments:
+        moto_session (fixture): Clears the package caches so moto is used.
+    """
+    result: List[Dict[str, str | bool]] | List[str] = get_region_list(include_list=["us-east-1", "eu-west-1"], details=True, refresh_descriptions=True)
+
+    expected_result: List[Dict[str, str]] = [
+        {"RegionName": "eu-west-1", "OptInStatus": "opt-in-not-required", "GeographicalLocation": "Europe (Ireland)"},
+        {"RegionName": "us-east-1", "OptInStatus": "opt-in-not-required", "GeographicalLocation": "US East (N. Virginia)"}
+    ]
+
+    assert result == expected_result  # nosec: B101
+
+
+def test_get_region_list_bundled_descriptions_match_ssm(moto_session) -> None:  # pylint: disable=unused-argument
+    """
+    Test that the bundled geographical locations cover every region and match those published in SSM.
+
+    Arguments:
+        moto_session (fixture): Clears the package caches so moto is used.
+    """
+    bundled: Dict[str, str] = functions._REGION_LONG_NAMES  # pylint: disable=protected-access
+
+    # Every region listed by EC2 or published in SSM must be bundled, so no default lookup falls back to SSM
+    paginator: Any = boto3.client("ssm").get_paginator("get_parameters_by_path")
+    published: List[str] = [
+        parameter['Value']
+        for page in paginator.paginate(Path="/aws/service/global-infrastructure/regions")
+        for parameter in page['Parameters']
+    ]
+    missing: List[str] = [region for region in set(get_region_list()) | set(published) if region not in bundled]
+    live: Dict[str, str] = functions._fetch_region_descriptions(list(bundled))  # pylint: disable=protected-access
+
+    assert not missing, f"Regions missing from _REGION_LONG_NAMES: {missing}"  # nosec: B101
+    assert live == bundled  # nosec: B101
+
+
+def test_get_region_list_refresh_not_cached(boto3_session_mock) -> None:
+    """
+    Test that live lookups neither read nor populate the result cache.
+
+    Arguments:
+        boto3_session_mock (fixture): The mocked boto3 session.
+    """
+    regions_mock: Any = boto3_session_mock.return_value.client("ec2")
+
+    live: List[Dict[str, str | bool]] | List[str] = get_region_list(include_list=["eu-west-1"], details=True, refresh_descriptions=True)
+    bundled: List[Dict[str, str | bool]] | List[str] = get_region_list(include_list=["eu-west-1"], details=True)
+    live_again: List[Dict[str, str | bool]] | List[str] = get_region_list(include_list=["eu-west-1"], details=True, refresh_descriptions=True)
+
+    assert live[0]["GeographicalLocation"] == "EU West (Ireland)"  # nosec: B101
+    assert bundled[0]["GeographicalLocation"] == "Europe (Ireland)"  # nosec: B101
+    assert live_again == live  # nosec: B101
+    assert regions_mock.describe_regions.call_count == 3  # nosec: B101
+
+    # Without details there is nothing to refresh, so the cache is used as normal
+    get_region_list(details=False, refresh_descriptions=True)
+    get_region_list(details=False, refresh_descriptions=True)
+
+    assert regions_mock.describe_regions.call_count == 4  # nosec: B101
+
+
+def test_get_region_list_cache_bounded(boto3_session_mock, monkeypatch) -> None:  # pylint: disable=unused-argument
+    """
+    Test that the result cache purges expired entries and evicts the oldest beyond its size limit.
+
+    Arguments:
+        boto3_session_mock (fixture): The mocked boto3 session.
+        monkeypatch (fixture): Used to shrink the cache limits.
+    """
+    cache: Dict[Any, Any] = functions._region_list_cache  # pylint: disable=protected-access
+
+    monkeypatch.setattr(functions, "_CACHE_MAX_ENTRIES", 2)
+    for region in ["us-east-1", "us-west-1", "eu-west-1"]:
+        get_region_list(include_list=[region])
+
+    assert [key[0] for key in cache] == [("us-west-1",), ("eu-west-1",)]  # nosec: B101
+
+    monkeypatch.setattr(functions, "_CACHE_TTL_SECONDS", 0)
+    get_region_list(include_list=["us-east-1"])
+
+    assert [key[0] for key in cache] == [("us-east-1",)]  # nosec: B101
+
+
 def test_get_region_list_exceptions(boto3_session_mock_with_exception) -> None:  # pylint: disable=unused-argument
     """
     Test exception handling when an error occurs in fetching regions.
@@ -139,3 +293,86 @@ def test_get_region_list_exceptions(boto3_session_mock_with_exception) -> None:
 
     # Verify the exception message
     assert str(excinfo.value).endswith("Test Exception")  # nosec: B101
+
+
+def test_get_region_list_description_exceptions(boto3_session_mock) -> None:
+    """
+    Test exception handling when an error occurs in fetching geographical locations.
+
+    Arguments:
+        boto3_session_mock (fixture): The mocked boto3 session.
+    """
+    ssm_mock: Any = boto3_session_mock.return_value.client("ssm")
+    ssm_mock.get_parameters.side_effect = Exception("SSM Exception")
+
+    with pytest.raises(RegionListingError) as excinfo:
+        get_region_list(details=True, refresh_descriptions=True)
+
+    assert str(excinfo.value).endswith("SSM Exception")  # nosec: B101
+
+
+def test_fetch_region_descriptions_cancels_pending_batches(boto3_session_mock, monkeypatch) -> None:
+    """
+    Test that the batches which have not started are cancelled once a batch fails.
+
+    The pool is replaced with a single worker and every request after the first blocks until the
+    failure has been raised, so any batch beyond the second can only be sent if it was not cancelled.
+
+    Arguments:
+        boto3_session_mock (fixture): The mocked boto3 session.
+        monkeypatch (fixture): Used to replace the shared thread pool.
+    """
+    ssm_mock: Any = boto3_session_mock.return_value.client("ssm")
+    release: threading.Event = threading.Event()
+    sent: List[List[str]] = []
+
+    def mock_get_parameters(Names) -> Dict[str, List[Any]]:
+        sent.append(Names)
+        if len(sent) == 1:
+            raise Exception("SSM Exception")
+        release.wait(timeout=5)
+        return {"Parameters": [], "InvalidParameters": Names}
+
+    ssm_mock.get_parameters.side_effect = mock_get_parameters
+
+    region_names: List[str] = [f"test-region-{i}" for i in range(functions._SSM_BATCH_SIZE * 5)]  # pylint: disable=protected-access
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        monkeypatch.setattr(functions, "_description_pool", pool)
+        try:
+            with pytest.raises(RegionListingError):
+                functions._fetch_region_descriptions(region_names)  # pylint: disable=protected-access
+        finally:
+            release.set()
+
+    assert len(sent) <= 2  # nosec: B101
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+@pytest.mark.filterwarnings("ignore:.*fork.*:DeprecationWarning")
+def test_fetch_region_descriptions_after_fork(boto3_session_mock) -> None:  # pylint: disable=unused-argument
+    """
+    Test that a forked child can still fetch geographical locations after the parent has used the thread pool.
+
+    The child inherits none of the parent's worker threads, so it must get a fresh pool rather than hang.
+    An alarm kills the child if it does hang.
+
+    Arguments:
+        boto3_session_mock (fixture): The mocked boto3 session.
+    """
+    region_names: List[str] = [region["RegionName"] for region in mock_regions]
+    expected: Dict[str, str] = functions._fetch_region_descriptions(region_names)  # pylint: disable=protected-access
+
+    pid: int = os.fork()
+    if pid == 0:
+        exit_code: int = 1
+        try:
+            signal.alarm(10)
+            if functions._fetch_region_descriptions(region_names) == expected:  # pylint: disable=protected-access
+                exit_code = 0
+        finally:
+            os._exit(exit_code)  # pylint: disable=protected-access
+
+    _, status = os.waitpid(pid, 0)
+
+    assert os.waitstatus_to_exitcode(status) == 0  # nosec: B101
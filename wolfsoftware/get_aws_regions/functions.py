@@ -3,21 +3,30 @@ This module provides functionalities for retrieving and processing AWS region in
 
 Capabilities:
   - Fetching a list of all AWS regions, with the option to include or exclude regions based on account opt-in status.
-  - Retrieving the geographical location description for a specific AWS region from the AWS Systems Manager (SSM) Parameter Store.
-  - Fetching geographical locations for multiple AWS regions using concurrent threading for improved performance.
+  - Retrieving the geographical location descriptions for AWS regions from the AWS Systems Manager (SSM) Parameter Store.
+  - Fetching geographical locations in batched requests, using concurrent threading for improved performance.
+  - Serving geographical locations for known regions from a bundled map, avoiding SSM requests entirely.
   - Applying include and exclude filters to the list of regions to customize the output.
   - Generating a comprehensive list of AWS regions, with optional detailed information about each region.
   - Utilizing different AWS profiles for the retrieval of region information.
+  - Caching results for a limited time so repeated calls do not query AWS again.
 
 Functions:
   - get_region_list: Main function to retrieve a list of AWS regions, optionally filtering by include and exclude lists,
     and returning detailed information if required.
 
 Private Functions:
+  - _get_description_pool: Returns the shared thread pool for SSM requests, creating it on first use.
+  - _reset_description_pool: Discards the shared thread pool in a forked child.
+  - _shutdown_description_pool: Shuts down the shared thread pool at interpreter exit.
+  - _get_session: Returns a cached boto3 session for the given profile.
+  - _get_client: Returns a cached boto3 service client for the given profile.
   - _fetch_all_regions: Retrieves a list of all AWS regions.
-  - _fetch_region_description: Fetches the geographical location for a specific AWS region.
-  - _fetch_region_descriptions: Fetches geographical locations for multiple AWS regions using threading.
-  - _apply_region_filters: Applies include and exclude filters to the list of regions.
+  - _fetch_region_description_batch: Fetches the geographical locations for a batch of AWS regions in a single request.
+  - _fetch_region_descriptions: Fetches geographical locations for multiple AWS regions using batched, threaded requests.
+  - _get_region_descriptions: Gets geographical locations from the bundled locations, falling back to SSM for unknown regions.
+  - _build_region_list: Builds the filtered list of regions from AWS, bypassing the result cache.
+  - _store_region_list: Stores a result in the bounded get_region_list cache.
 
 Exceptions:
   - RegionListingError: Custom exception class to handle errors related to AWS region retrieval and processing.
@@ -27,6 +36,9 @@ Dependencies:
   - concurrent.futures: Standard library module to enable asynchronous execution using threading.
   - botocore.exceptions: Exceptions for handling errors during boto3 operations.
 
+  boto3 and botocore are imported on first use rather than at import time, so importing the
+  package (e.g. for RegionListingError or __version__) stays cheap.
+
 Usage:
   This module is intended to be used as part of the wolfsoftware.get-aws-regions package.
   The main entry point is the `get_region_list` function, which provides flexibility in retrieving
@@ -34,18 +46,165 @@ Usage:
   to specify different AWS profiles.
 """
 
-from typing import Any, List, Dict, Optional, Union
+import atexit
+import copy
+import functools
+import os
+import threading
+import time
+
+from operator import itemgetter
+from typing import Any, FrozenSet, List, Dict, Optional, Tuple, Union
 
 from concurrent.futures._base import Future
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import boto3  # pylint: disable=import-error
-from botocore.exceptions import BotoCoreError, ClientError
-
 from .exceptions import RegionListingError
 
+# SSM parameter names for region geographical locations are _SSM_REGION_PREFIX + <region> + _SSM_REGION_SUFFIX
+_SSM_REGION_PREFIX: str = "/aws/service/global-infrastructure/regions/"
+_SSM_REGION_SUFFIX: str = "/longName"
+
+# GetParameters accepts at most 10 names per request
+_SSM_BATCH_SIZE: int = 10
+
+# Number of concurrent GetParameters requests
+_SSM_MAX_WORKERS: int = 4
+
+# Shared thread pool for SSM requests, created on first use by _get_description_pool and reused across calls
+_description_pool: Optional[ThreadPoolExecutor] = None
+_description_pool_lock: threading.Lock = threading.Lock()
+
+# How long get_region_list results are reused before AWS is queried again
+_CACHE_TTL_SECONDS: int = 3600
+
+# Upper bound on cached get_region_list results; the oldest are evicted first
+_CACHE_MAX_ENTRIES: int = 128
+
+# Cached get_region_list results, keyed by the normalised arguments and stamped with time.monotonic()
+_region_list_cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+_region_list_cache_lock: threading.Lock = threading.Lock()
+
+# Bundled geographical locations for known regions, as published in SSM under the region parameter names above
+_REGION_LONG_NAMES: Dict[str, str] = {
+    "af-south-1": "Africa (Cape Town)",
+    "ap-east-1": "Asia Pacific (Hong Kong)",
+    "ap-east-2": "Asia Pacific (Taipei)",
+    "ap-northeast-1": "Asia Pacific (Tokyo)",
+    "ap-northeast-2": "Asia Pacific (Seoul)",
+    "ap-northeast-3": "Asia Pacific (Osaka)",
+    "ap-south-1": "Asia Pacific (Mumbai)",
+    "ap-south-2": "Asia Pacific (Hyderabad)",
+    "ap-southeast-1": "Asia Pacific (Singapore)",
+    "ap-southeast-2": "Asia Pacific (Sydney)",
+    "ap-southeast-3": "Asia Pacific (Jakarta)",
+    "ap-southeast-4": "Asia Pacific (Melbourne)",
+    "ap-southeast-5": "Asia Pacific (Malaysia)",
+    "ap-southeast-6": "Asia Pacific (New Zealand)",
+    "ap-southeast-7": "Asia Pacific (Thailand)",
+    "ca-central-1": "Canada (Central)",
+    "ca-west-1": "Canada West (Calgary)",
+    "cn-north-1": "China (Beijing)",
+    "cn-northwest-1": "China (Ningxia)",
+    "eu-central-1": "Europe (Frankfurt)",
+    "eu-central-2": "Europe (Zurich)",
+    "eu-north-1": "Europe (Stockholm)",
+    "eu-south-1": "Europe (Milan)",
+    "eu-south-2": "Europe (Spain)",
+    "eu-west-1": "Europe (Ireland)",
+    "eu-west-2": "Europe (London)",
+    "eu-west-3": "Europe (Paris)",
+    "eusc-de-east-1": "AWS European Sovereign Cloud (Germany)",
+    "il-central-1": "Israel (Tel Aviv)",
+    "me-central-1": "Middle East (UAE)",
+    "me-south-1": "Middle East (Bahrain)",
+    "mx-central-1": "Mexico (Central)",
+    "sa-east-1": "South America (Sao Paulo)",
+    "us-east-1": "US East (N. Virginia)",
+    "us-east-2": "US East (Ohio)",
+    "us-gov-east-1": "AWS GovCloud (US-East)",
+    "us-gov-west-1": "AWS GovCloud (US-West)",
+    "us-west-1": "US West (N. California)",
+    "us-west-2": "US West (Oregon)"
+}
+
+
+def _get_description_pool() -> ThreadPoolExecutor:
+    """
+    Return the shared thread pool for SSM requests, creating it on first use.
+
+    Returns:
+        ThreadPoolExecutor: The shared thread pool.
+    """
+    global _description_pool
+
+    with _description_pool_lock:
+        if _description_pool is None:
+            _description_pool = ThreadPoolExecutor(max_workers=_SSM_MAX_WORKERS, thread_name_prefix="aws-regions")
+        return _description_pool
+
+
+def _reset_description_pool() -> None:
+    """
+    Discard the shared thread pool in a forked child.
+
+    The child inherits the pool's state but none of its worker threads, so submitted work would never run.
+    A new pool is created on next use instead.
+    """
+    global _description_pool, _description_pool_lock
+
+    _description_pool = None
+    _description_pool_lock = threading.Lock()
+
+
+def _shutdown_description_pool() -> None:
+    """Shut down the shared thread pool at interpreter exit, if it was ever created."""
+    if _description_pool is not None:
+        _description_pool.shutdown()
+
+
+atexit.register(_shutdown_description_pool)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_description_pool)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_session(profile_name: Optional[str] = None) -> Any:
+    """
+    Return a cached boto3 session for the specified profile.
+
+    Arguments:
+        profile_name (Optional[str]): The name of the AWS profile to use.
+
+    Returns:
+        boto3.Session: The session for the given profile, created on first use.
+    """
+    # boto3 is imported on first use as it is slow to import and not needed by every importer of the package
+    import boto3  # pylint: disable=import-error,import-outside-toplevel
+
+    return boto3.Session(profile_name=profile_name) if profile_name else boto3.Session()
 
-def _fetch_all_regions(all_regions: bool = True, profile_name: Optional[str] = None) -> List[Dict[str, Union[str, bool]]]:
+
+@functools.lru_cache(maxsize=None)
+def _get_client(profile_name: Optional[str], service: str) -> Any:
+    """
+    Return a cached boto3 client for the specified profile and service.
+
+    Arguments:
+        profile_name (Optional[str]): The name of the AWS profile to use.
+        service (str): The name of the AWS service, e.g. 'ec2' or 'ssm'.
+
+    Returns:
+        Any: The service client, created on first use.
+    """
+    return _get_session(profile_name).client(service)
+
+
+def _fetch_all_regions(
+    all_regions: bool = True,
+    profile_name: Optional[str] = None,
+    names_only: bool = False
+) -> Union[List[Dict[str, Any]], List[str]]:
     """
     Retrieve a list of all AWS regions.
 
@@ -53,17 +212,19 @@ def _fetch_all_regions(all_regions: bool = True, profile_name: Optional[str] = N
         all_regions (bool): If True, list all available regions, including those not opted into.
                             If False, list only regions opted into by the account.
         profile_name (Optional[str]): The name of the AWS profile to use.
+        names_only (bool): If True, return only the region names.
 
     Returns:
-        List[Dict[str, Union[str, bool]]]: A list of dictionaries containing information about each region.
+        Union[List[Dict[str, Any]], List[str]]: The regions as returned by describe_regions, or just their names.
 
     Raises:
         RegionListingError: If there is an error in retrieving the regions.
     """
+    from botocore.exceptions import BotoCoreError, ClientError  # pylint: disable=import-error,import-outside-toplevel
+
     try:
-        # Initialize a session using Amazon EC2 with the specified profile
-        session = boto3.Session(profile_name=profile_name) if profile_name else boto3.Session()
-        ec2: Any = session.client('ec2')
+        # Reuse the cached EC2 client for the specified profile
+        ec2: Any = _get_client(profile_name, 'ec2')
 
         # Retrieve a list of all available regions or only opted-in regions based on the flag
         if all_regions:
@@ -71,13 +232,10 @@ def _fetch_all_regions(all_regions: bool = True, profile_name: Optional[str] = N
         else:
             response: Any = ec2.describe_regions()
 
-        # We only keep RegionName and OptInStatus
-        regions: List[Dict[str, Any]] = [
-            {"RegionName": region['RegionName'], "OptInStatus": region['OptInStatus']}
-            for region in response['Regions']
-        ]
+        if names_only:
+            return [region['RegionName'] for region in response['Regions']]
 
-        return regions
+        return response['Regions']
 
     except (BotoCoreError, ClientError) as e:
         raise RegionListingError(f"An error occurred while listing regions: {str(e)}") from e
@@ -85,40 +243,45 @@ def _fetch_all_regions(all_regions: bool = True, profile_name: Optional[str] = N
         raise RegionListingError(f"An unexpected error occurred: {str(e)}") from e
 
 
-def _fetch_region_description(region_name: str, profile_name: Optional[str] = None) -> Dict[str, str]:
+def _fetch_region_description_batch(ssm: Any, region_names: List[str]) -> Dict[str, str]:
     """
-    Fetch the geographical location for a specific AWS region from SSM Parameter Store.
+    Fetch the geographical locations for a batch of AWS regions from SSM Parameter Store in a single request.
 
     Arguments:
-        region_name (str): The name of the region to fetch the geographical location for.
-        profile_name (Optional[str]): The name of the AWS profile to use.
+        ssm (Any): The SSM client to use, shared between worker threads.
+        region_names (List[str]): The names of the regions to fetch geographical locations for (at most _SSM_BATCH_SIZE).
 
     Returns:
-        Dict[str, str]: A dictionary containing the region name and its geographical location.
+        Dict[str, str]: A dictionary mapping region codes to their geographical locations.
 
     Raises:
-        RegionListingError: If there is an error in retrieving the region geographical location.
+        RegionListingError: If there is an error in retrieving the region geographical locations.
     """
-    try:
-        # Initialize a session using Amazon SSM with the specified profile
-        session = boto3.Session(profile_name=profile_name) if profile_name else boto3.Session()
-        ssm: Any = session.client('ssm')
+    from botocore.exceptions import BotoCoreError, ClientError  # pylint: disable=import-error,import-outside-toplevel
 
-        # Retrieve the parameter for the region description
-        parameter_name: str = f"/aws/service/global-infrastructure/regions/{region_name}/longName"
-        response: Any = ssm.get_parameter(Name=parameter_name)
+    try:
+        # Retrieve the parameters for the region descriptions in one call
+        parameter_names: List[str] = [_SSM_REGION_PREFIX + region_name + _SSM_REGION_SUFFIX for region_name in region_names]
+        response: Any = ssm.get_parameters(Names=parameter_names)
 
-        return {region_name: response['Parameter']['Value']}
+        # Recover the region name by slicing off the known prefix and suffix
+        start: int = len(_SSM_REGION_PREFIX)
+        end: int = -len(_SSM_REGION_SUFFIX)
+        return {parameter['Name'][start:end]: parameter['Value'] for parameter in response['Parameters']}
 
     except (BotoCoreError, ClientError) as e:
-        raise RegionListingError(f"An error occurred while retrieving geographical location for region {region_name}: {str(e)}") from e
+        raise RegionListingError(f"An error occurred while retrieving geographical locations for regions {', '.join(region_names)}: {str(e)}") from e
     except Exception as e:
         raise RegionListingError(f"An unexpected error occurred: {str(e)}") from e
 
 
 def _fetch_region_descriptions(region_names: List[str], profile_name: Optional[str] = None) -> Dict[str, str]:
     """
-    Fetch geographical locations for multiple AWS regions from SSM Parameter Store using threading for better performance.
+    Fetch geographical locations for multiple AWS regions from SSM Parameter Store using batched requests.
+
+    Region names are grouped into batches of _SSM_BATCH_SIZE (the GetParameters limit) and the batches
+    are fetched concurrently using the shared thread pool from _get_description_pool. If any batch fails, the
+    batches that have not started yet are cancelled.
 
     Arguments:
         region_names (List[str]): A list of region names to fetch geographical locations for.
@@ -130,51 +293,149 @@ def _fetch_region_descriptions(region_names: List[str], profile_name: Optional[s
     Raises:
         RegionListingError: If there is an error in retrieving the region geographical locations.
     """
+    if not region_names:
+        return {}
+
     descriptions: Dict = {}
 
-    with ThreadPoolExecutor() as executor:
-        future_to_region: Dict[Future[Dict[str, str]], str] = {
-            executor.submit(_fetch_region_description, region, profile_name): region
-            for region in region_names
-        }
+    batches: List[List[str]] = [region_names[i:i + _SSM_BATCH_SIZE] for i in range(0, len(region_names), _SSM_BATCH_SIZE)]
 
-        for future in as_completed(future_to_region):
-            region: str = future_to_region[future]
-            try:
-                result: Dict[str, str] = future.result()
-                descriptions.update(result)
-            except Exception as e:
-                raise RegionListingError(f"An unexpected error occurred while fetching geographical locations for {region}: {str(e)}") from e
+    # Look up the client once; boto3 clients are safe to share between threads
+    try:
+        ssm: Any = _get_client(profile_name, 'ssm')
+    except Exception as e:
+        raise RegionListingError(f"An unexpected error occurred while creating the SSM client: {str(e)}") from e
+
+    future_to_batch: Dict[Future[Dict[str, str]], List[str]] = {
+        _get_description_pool().submit(_fetch_region_description_batch, ssm, batch): batch
+        for batch in batches
+    }
+
+    for future in as_completed(future_to_batch):
+        batch: List[str] = future_to_batch[future]
+        try:
+            result: Dict[str, str] = future.result()
+            descriptions.update(result)
+        except Exception as e:
+            # Fail fast: cancel the batches that have not started yet rather than letting them run for nothing
+            for pending in future_to_batch:
+                pending.cancel()
+            raise RegionListingError(f"An unexpected error occurred while fetching geographical locations for {', '.join(batch)}: {str(e)}") from e
 
     return descriptions
 
 
-def _apply_region_filters(
-    regions: List[Dict[str, Union[str, bool]]],
+def _get_region_descriptions(region_names: List[str], profile_name: Optional[str] = None, refresh: Optional[bool] = False) -> Dict[str, str]:
+    """
+    Get geographical locations for multiple AWS regions, preferring the bundled locations.
+
+    Arguments:
+        region_names (List[str]): A list of region names to get geographical locations for.
+        profile_name (Optional[str]): The name of the AWS profile to use.
+        refresh (bool): If True, fetch all geographical locations from SSM Parameter Store instead of using the bundled locations.
+
+    Returns:
+        Dict[str, str]: A dictionary mapping region codes to their geographical locations.
+
+    Raises:
+        RegionListingError: If there is an error in retrieving the region geographical locations.
+    """
+    if refresh:
+        return _fetch_region_descriptions(region_names, profile_name)
+
+    descriptions: Dict[str, str] = {region: _REGION_LONG_NAMES[region] for region in region_names if region in _REGION_LONG_NAMES}
+
+    # Only regions newer than the bundled locations need a round-trip to SSM
+    missing: List[str] = [region for region in region_names if region not in descriptions]
+    if missing:
+        descriptions.update(_fetch_region_descriptions(missing, profile_name))
+
+    return descriptions
+
+
+def _build_region_list(
     include_list: Optional[List[str]] = None,
-    exclude_list: Optional[List[str]] = None
-) -> List[Dict[str, Union[str, bool]]]:
+    exclude_list: Optional[List[str]] = None,
+    all_regions: Optional[bool] = True,
+    details: Optional[bool] = False,
+    profile_name: Optional[str] = None,
+    refresh_descriptions: Optional[bool] = False
+) -> Union[List[Dict[str, Union[str, bool]]], List[str]]:
     """
-    Apply include and exclude filters to the list of regions.
+    Build a list of AWS regions from AWS, bypassing the result cache.
 
     Arguments:
-        regions (List[Dict[str, Union[str, bool]]]): The list of regions to filter.
         include_list (Optional[List[str]]): A list of regions to include. Only these regions will be returned if specified.
         exclude_list (Optional[List[str]]): A list of regions to exclude. These regions will be omitted from the returned list if specified.
+        all_regions (bool): If True, list all available regions, including those not opted into. If False, list only regions opted into by the account.
+        details (bool): If True, return detailed information about each region. If False, return only the region names.
+        profile_name (Optional[str]): The name of the AWS profile to use.
+        refresh_descriptions (bool): If True, fetch geographical locations live from SSM Parameter Store.
+                                     If False, use the bundled locations and only query SSM for unknown regions.
 
     Returns:
-        List[Dict[str, Union[str, bool]]]: A sorted list of regions after applying the filters.
+        Union[List[Dict[str, Union[str, bool]]], List[str]]: A sorted list of regions with detailed information or just the region names.
+
+    Raises:
+        RegionListingError: If there is an error in retrieving the regions.
     """
-    if include_list is not None:
-        regions = [region for region in regions if region['RegionName'] in include_list]
+    try:
+        all_regions_list: Union[List[Dict[str, Any]], List[str]] = _fetch_all_regions(all_regions, profile_name, names_only=not details)
+    except Exception as e:
+        raise RegionListingError(f"An error occurred while retrieving regions: {str(e)}") from e
 
-    if exclude_list is not None:
-        regions = [region for region in regions if region['RegionName'] not in exclude_list]
+    include_set: Optional[FrozenSet[str]] = frozenset(include_list) if include_list is not None else None
+    exclude_set: Optional[FrozenSet[str]] = frozenset(exclude_list) if exclude_list is not None else None
+
+    if not details:
+        # Only the names are needed, so filter and sort them directly without building any dicts
+        names: List[str] = [
+            name for name in all_regions_list
+            if (include_set is None or name in include_set) and (exclude_set is None or name not in exclude_set)
+        ]
+        names.sort()
+        return names
+
+    # Filter the regions and keep only RegionName and OptInStatus in a single pass
+    filtered_regions: List[Dict[str, Union[str, bool]]] = []
+    region_names: List[str] = []
+    for region in all_regions_list:
+        region_name: str = region['RegionName']
+        if (include_set is not None and region_name not in include_set) or (exclude_set is not None and region_name in exclude_set):
+            continue
+        filtered_regions.append({"RegionName": region_name, "OptInStatus": region['OptInStatus']})
+        region_names.append(region_name)
 
     # Sort regions alphabetically by Region
-    regions.sort(key=lambda x: x['RegionName'])
+    filtered_regions.sort(key=itemgetter('RegionName'))
+
+    if filtered_regions:
+        region_descriptions: Dict[str, str] = _get_region_descriptions(region_names, profile_name, refresh_descriptions)
+        for region in filtered_regions:
+            region['GeographicalLocation'] = region_descriptions.get(region['RegionName'], "Unknown")
+    return filtered_regions
+
+
+def _store_region_list(key: Tuple[Any, ...], regions: Union[List[Dict[str, Union[str, bool]]], List[str]]) -> None:
+    """
+    Store a get_region_list result, purging expired entries and evicting the oldest beyond _CACHE_MAX_ENTRIES.
+
+    Arguments:
+        key (Tuple[Any, ...]): The normalised arguments the result was built for.
+        regions (Union[List[Dict[str, Union[str, bool]]], List[str]]): The result to cache.
+    """
+    now: float = time.monotonic()
 
-    return regions
+    with _region_list_cache_lock:
+        for expired in [k for k, (stamp, _) in _region_list_cache.items() if now - stamp >= _CACHE_TTL_SECONDS]:
+            del _region_list_cache[expired]
+
+        # Re-insert so the entry moves to the end of the (insertion ordered) eviction queue
+        _region_list_cache.pop(key, None)
+        _region_list_cache[key] = (now, regions)
+
+        while len(_region_list_cache) > _CACHE_MAX_ENTRIES:
+            del _region_list_cache[next(iter(_region_list_cache))]
 
 
 def get_region_list(
@@ -182,19 +443,28 @@ def get_region_list(
     exclude_list: Optional[List[str]] = None,
     all_regions: Optional[bool] = True,
     details: Optional[bool] = False,
-    profile_name: Optional[str] = None
+    profile_name: Optional[str] = None,
+    refresh_descriptions: Optional[bool] = False
 ) -> Union[List[Dict[str, Union[str, bool]]], List[str]]:
     """
     Retrieve a list of AWS regions, optionally filtering by include and exclude lists.
 
     Optionally return detailed information about each region or just the region names.
 
+    Results are cached per set of arguments for _CACHE_TTL_SECONDS, keeping at most _CACHE_MAX_ENTRIES
+    results. Use get_region_list.cache_clear() to discard cached results. Calls with details=True and
+    refresh_descriptions=True bypass the cache entirely: they always query AWS and their results are not
+    stored, so later calls keep using the bundled locations. Without details, refresh_descriptions has
+    no effect and the cache is used as normal.
+
     Arguments:
         include_list (Optional[List[str]]): A list of regions to include. Only these regions will be returned if specified.
         exclude_list (Optional[List[str]]): A list of regions to exclude. These regions will be omitted from the returned list if specified.
         all_regions (bool): If True, list all available regions, including those not opted into. If False, list only regions opted into by the account.
         details (bool): If True, return detailed information about each region. If False, return only the region names.
         profile_name (Optional[str]): The name of the AWS profile to use.
+        refresh_descriptions (bool): If True, fetch geographical locations live from SSM Parameter Store.
+                                     If False, use the bundled locations and only query SSM for unknown regions.
 
     Returns:
         Union[List[Dict[str, Union[str, bool]]], List[str]]: A sorted list of regions with detailed information or just the region names.
@@ -202,17 +472,28 @@ def get_region_list(
     Raises:
         RegionListingError: If there is an error in retrieving the regions.
     """
-    try:
-        all_regions_list: List[Dict[str, str | bool]] = _fetch_all_regions(all_regions, profile_name)
-    except Exception as e:
-        raise RegionListingError(f"An error occurred while retrieving regions: {str(e)}") from e
+    # Live lookups neither read nor populate the cache, so they never change what default calls return
+    if details and refresh_descriptions:
+        return _build_region_list(include_list, exclude_list, all_regions, details, profile_name, refresh_descriptions)
 
-    filtered_regions: List[Dict[str, str | bool]] = _apply_region_filters(all_regions_list, include_list, exclude_list)
+    key: Tuple[Any, ...] = (
+        tuple(sorted(set(include_list))) if include_list is not None else None,
+        tuple(sorted(set(exclude_list))) if exclude_list is not None else None,
+        bool(all_regions),
+        bool(details),
+        profile_name
+    )
 
-    if details:
-        region_names: List[str | bool] = [region['RegionName'] for region in filtered_regions]
-        region_descriptions: Dict[str, str] = _fetch_region_descriptions(region_names, profile_name)
-        for region in filtered_regions:
-            region['GeographicalLocation'] = region_descriptions.get(region['RegionName'], "Unknown")
-        return filtered_regions
-    return [region['RegionName'] for region in filtered_regions]
+    cached: Optional[Tuple[float, Any]] = _region_list_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _CACHE_TTL_SECONDS:
+        return copy.deepcopy(cached[1])
+
+    regions: Union[List[Dict[str, Union[str, bool]]], List[str]] = _build_region_list(
+        include_list, exclude_list, all_regions, details, profile_name
+    )
+    _store_region_list(key, regions)
+
+    return copy.deepcopy(regions)
+
+
+get_region_list.cache_clear = _region_list_cache.clear  # type: ignore[attr-defined]